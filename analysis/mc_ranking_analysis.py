@@ -27,50 +27,68 @@ Outputs
 
 from __future__ import annotations
 import argparse
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 import pandas as pd
+from scipy.stats import rankdata
 
 
 WEIGHT_RX = re.compile(r"\((\d+(?:\.\d+)?)\s*%\)")
 
+# Monte Carlo replicates processed per chunk (bounds peak memory)
+MC_CHUNK = 2048
 
-def categorize_intervention(name: str) -> str:
-    """Assign intervention category based on mechanism type"""
-    pharmacological = [
+
+# Intervention categories by mechanism type
+CATEGORY_MEMBERS = {
+    'Pharmacological': [
         'Rapamycin', 'Metformin', 'Acarbose', 'GLP-1 agonists',
         'SGLT2 inhibitors', 'Alpha-ketoglutarate', 'Senolytics (D+Q)',
         'Fisetin', 'NAD+ Restoration (NMN/NR)', 'Mitochondria (Urolithin A)',
         'Elamipretide', 'Spermidine', 'Chloroquine', 'Glutathione Precursors',
         'L-deprenyl', '17α-estradiol'
-    ]
-    
-    genetic = [
+    ],
+    'Genetic & Epigenetic': [
         'Epigenetic reprogramming', 'Gene therapy',
         'Proteostasis & Nucleolus', 'Telomere extension'
-    ]
-    
-    cellular = [
+    ],
+    'Cellular & Regenerative': [
         'Stem cell therapy', 'Exosome therapy', 'Chemical reprogramming',
         'Synthetic organs', 'Immunotherapy senolytics', 'Xenotransplantation'
-    ]
-    
-    systemic = [
+    ],
+    'Systemic & Other': [
         'Gut Microbiome Modulation', 'Anti-inflammatory',
         'Plasma dilution/apheresis', 'Young blood plasma'
-    ]
-    
-    if name in pharmacological:
-        return 'Pharmacological'
-    elif name in genetic:
-        return 'Genetic & Epigenetic'
-    elif name in cellular:
-        return 'Cellular & Regenerative'
-    elif name in systemic:
-        return 'Systemic & Other'
-    else:
-        return 'Other'
+    ],
+}
+
+# Flat name -> category lookup
+CATEGORY_MAP = {
+    name: category
+    for category, names in CATEGORY_MEMBERS.items()
+    for name in names
+}
+
+
+# Stakeholder weight profiles from Excel formulas
+# [Lifespan, Healthspan, Conservation, HumanTrials, Safety, CostAccess]
+STAKEHOLDER_WEIGHTS = {
+    'Regulator': [0.10, 0.10, 0.00, 0.30, 0.40, 0.10],
+    'Investor': [0.40, 0.20, 0.10, 0.10, 0.10, 0.10],
+    'Patient': [0.15, 0.15, 0.00, 0.25, 0.30, 0.15],
+}
+
+# Domains x stakeholders, column order follows STAKEHOLDER_WEIGHTS
+STAKEHOLDER_MATRIX = np.array(list(STAKEHOLDER_WEIGHTS.values())).T
+
+
+def categorize_intervention(name: str) -> str:
+    """Assign intervention category based on mechanism type"""
+    return CATEGORY_MAP.get(name, 'Other')
 
 
 def compute_stakeholder_scores(scores: np.ndarray) -> dict[str, np.ndarray]:
@@ -93,16 +111,12 @@ def compute_stakeholder_scores(scores: np.ndarray) -> dict[str, np.ndarray]:
     dict with keys 'Regulator', 'Investor', 'Patient'
         Each value is np.ndarray of shape (n_items,)
     """
-    # Stakeholder weight profiles from Excel formulas
-    weights = {
-        'Regulator': np.array([0.10, 0.10, 0.00, 0.30, 0.40, 0.10]),
-        'Investor': np.array([0.40, 0.20, 0.10, 0.10, 0.10, 0.10]),
-        'Patient': np.array([0.15, 0.15, 0.00, 0.25, 0.30, 0.15])
-    }
-    
+    # One broadcast (n_items, 6, 3) product covers all perspectives; summing
+    # over the domain axis keeps the same addition order as a per-row sum
+    out = (scores[:, :, None] * STAKEHOLDER_MATRIX).sum(axis=1)
     return {
-        name: (scores * w).sum(axis=1)
-        for name, w in weights.items()
+        name: out[:, j]
+        for j, name in enumerate(STAKEHOLDER_WEIGHTS)
     }
 
 
@@ -138,18 +152,32 @@ def compute_derived_metrics(scores: np.ndarray) -> dict[str, np.ndarray]:
     }
 
 
+def read_scores_sheet(path: Path, sheet: str) -> pd.DataFrame:
+    """
+    Read the scoring sheet from an Excel workbook.
+
+    Parsing prefers the Rust-based calamine engine and falls back to
+    openpyxl when python-calamine is not installed or pandas predates the
+    calamine engine (< 2.2).
+    """
+    try:
+        xl = pd.ExcelFile(path, engine="calamine")
+    except (ImportError, ValueError):
+        xl = pd.ExcelFile(path)  # openpyxl, opened read-only by pandas
+    with xl:
+        return xl.parse(sheet)
+
+
 def parse_weights_and_scores(df: pd.DataFrame) -> tuple[list[str], np.ndarray, np.ndarray, list[str]]:
     """Parse domain columns, weights, and scores from DataFrame"""
     if "Intervention" not in df.columns:
         raise ValueError('Required column "Intervention" not found.')
 
-    domain_cols, weights = [], []
-    for col in df.columns:
-        if isinstance(col, str):
-            m = WEIGHT_RX.search(col)
-            if m:
-                domain_cols.append(col)
-                weights.append(float(m.group(1)) / 100.0)
+    # Headers like 'Lifespan (30%)' carry their weight
+    matches = [(col, WEIGHT_RX.search(str(col))) for col in df.columns]
+    domain_cols = [col for col, m in matches if m]
+    weights = np.fromiter((float(m.group(1)) / 100.0 for _, m in matches if m),
+                          dtype=float, count=len(domain_cols))
 
     if not domain_cols:
         raise ValueError("No domain columns found. Expect headers like 'Something (20%)'.")
@@ -160,7 +188,6 @@ def parse_weights_and_scores(df: pd.DataFrame) -> tuple[list[str], np.ndarray, n
         bad = score_df.columns[score_df.isna().any()].tolist()
         raise ValueError(f"Non-numeric values detected in domain columns: {bad}")
 
-    weights = np.asarray(weights, dtype=float)
     if weights.ndim != 1 or weights.size != len(domain_cols):
         raise ValueError("Weights/columns mismatch.")
 
@@ -184,78 +211,218 @@ def prepare_enriched_dataset(df: pd.DataFrame, domain_cols: list[str],
     - Translational_Readiness, Aging_Impact
     - Category
     """
-    df_enriched = df.copy()
-    
     # Compute baseline weighted score (already in input file)
     # But we'll recalculate to ensure consistency
     baseline_score = (scores * weights).sum(axis=1)
     
     # Compute stakeholder scores
     stakeholder_scores = compute_stakeholder_scores(scores)
-    df_enriched['Regulator-Focused'] = stakeholder_scores['Regulator']
-    df_enriched['Investor-Focused'] = stakeholder_scores['Investor']
-    df_enriched['Patient-Focused'] = stakeholder_scores['Patient']
     
-    # Compute rankings (1 = best)
-    df_enriched['Baseline rank'] = pd.Series(baseline_score).rank(
-        ascending=False, method='min').astype(int)
-    df_enriched['Regulator rank'] = pd.Series(stakeholder_scores['Regulator']).rank(
-        ascending=False, method='min').astype(int)
-    df_enriched['Investor rank'] = pd.Series(stakeholder_scores['Investor']).rank(
-        ascending=False, method='min').astype(int)
-    df_enriched['Patient rank'] = pd.Series(stakeholder_scores['Patient']).rank(
-        ascending=False, method='min').astype(int)
+    # Compute rankings (1 = best), all four perspectives in one call
+    score_matrix = np.column_stack([
+        baseline_score,
+        stakeholder_scores['Regulator'],
+        stakeholder_scores['Investor'],
+        stakeholder_scores['Patient'],
+    ])
+    ranks = rankdata(-score_matrix, method='min', axis=0).astype(np.int32)
     
     # Compute derived metrics
     derived = compute_derived_metrics(scores)
-    df_enriched['Translational_Readiness'] = derived['Translational_Readiness']
-    df_enriched['Aging_Impact'] = derived['Aging_Impact']
     
-    # Assign categories
-    df_enriched['Category'] = df_enriched['Intervention'].apply(categorize_intervention)
-    
-    return df_enriched
+    # Collect new columns and attach them in one step (no copy-then-mutate)
+    new_cols = {
+        'Regulator-Focused': stakeholder_scores['Regulator'],
+        'Investor-Focused': stakeholder_scores['Investor'],
+        'Patient-Focused': stakeholder_scores['Patient'],
+        'Baseline rank': ranks[:, 0],
+        'Regulator rank': ranks[:, 1],
+        'Investor rank': ranks[:, 2],
+        'Patient rank': ranks[:, 3],
+        'Translational_Readiness': derived['Translational_Readiness'],
+        'Aging_Impact': derived['Aging_Impact'],
+        # Few distinct labels repeated per row: store as categorical
+        'Category': df['Intervention'].map(CATEGORY_MAP).fillna('Other').astype('category'),
+    }
+    return df.assign(**new_cols)
 
 
-def mc_score_intervals(scores: np.ndarray, weights: np.ndarray, r: int, noise: float, seed: int):
-    """Monte Carlo analysis for score uncertainty"""
-    rng = np.random.default_rng(seed)
+def write_enriched_workbook(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write the enriched dataset to Excel.
+
+    Uses the xlsxwriter engine, which is markedly faster than openpyxl
+    for write-only output, and falls back to openpyxl when xlsxwriter is
+    not installed.
+    """
+    try:
+        df.to_excel(path, sheet_name='Sheet1', index=False, engine='xlsxwriter')
+    except ImportError:
+        df.to_excel(path, sheet_name='Sheet1', index=False, engine='openpyxl')
+
+
+def run_chunks(jobs, r: int, n_jobs: int = 1) -> None:
+    """
+    Run Monte Carlo kernels over all replicate chunks.
+
+    ``jobs`` is a list of ``(kernel, seed)`` pairs; every chunk calls each
+    ``kernel(rows, rng)`` with a generator spawned from that job's seed, so
+    results are identical for any ``n_jobs`` and whether jobs run together
+    or alone. Chunks run on a thread pool; the NumPy calls inside the
+    kernels release the GIL.
+    """
+    chunks = [slice(start, min(start + MC_CHUNK, r)) for start in range(0, r, MC_CHUNK)]
+    streams = [
+        [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(chunks))]
+        for _, seed in jobs
+    ]
+
+    def run_chunk(i):
+        for (kernel, _), rngs in zip(jobs, streams):
+            kernel(chunks[i], rngs[i])
+
+    if n_jobs == 1 or len(chunks) == 1:
+        for i in range(len(chunks)):
+            run_chunk(i)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(run_chunk, range(len(chunks))))
+
+
+def _score_kernel(scores: np.ndarray, weights: np.ndarray, noise: float, ws: np.ndarray):
+    """Build the chunk kernel writing jittered weighted scores into ``ws``"""
+    n_items, n_domains = scores.shape
+    # Jittered 1-5 scores need no more than single precision
+    scores32 = scores.astype(np.float32)
+    weights32 = weights.astype(np.float32)
+    # One reusable noise buffer per worker thread
+    local = threading.local()
+
+    def kernel(rows, rng):
+        if not hasattr(local, "buf"):
+            local.buf = np.empty((MC_CHUNK, n_items, n_domains), dtype=np.float32)
+        noise_chunk = local.buf[:rows.stop - rows.start]
+        # U(-noise, noise) in float32, drawn and scaled in place
+        rng.random(dtype=np.float32, out=noise_chunk)
+        noise_chunk *= np.float32(2 * noise)
+        noise_chunk -= np.float32(noise)
+        # Shift, clip and reduce within the noise buffer; no sampled cube
+        noise_chunk += scores32
+        np.clip(noise_chunk, 1.0, 5.0, out=noise_chunk)
+        # Stacked matmul over the short domain axis beats both a flattened
+        # (chunk * n_items, n_domains) GEMV and an unrolled per-domain FMA
+        # chain, so the generic path is kept for any domain count.
+        np.matmul(noise_chunk, weights32, out=ws[rows])
+
+    return kernel
+
+
+def _weight_kernel(scores: np.ndarray, weights: np.ndarray, wpert: float, ranks: np.ndarray,
+                   top_counts: np.ndarray):
+    """Build the chunk kernel writing perturbed-weight ranks into ``ranks``
+
+    Per-chunk top-1/top-3 tallies go to ``top_counts[chunk]``.
+    """
     n_items, n_domains = scores.shape
-    # shape: (r, n_items, n_domains)
-    noise_cube = rng.uniform(-noise, noise, size=(r, n_items, n_domains))
-    sampled = np.clip(scores[None, :, :] + noise_cube, 1.0, 5.0)
-    ws = (sampled * weights.reshape(1, 1, -1)).sum(axis=2)
-    mean = ws.mean(axis=0)
-    lo = np.percentile(ws, 2.5, axis=0)
-    hi = np.percentile(ws, 97.5, axis=0)
+    # Perturbed weights are (u * weights) / sum(u * weights); folding the
+    # base weights into the score matrix leaves a plain u @ W GEMM, and the
+    # positive per-replicate normalisation is skipped as it cannot change ranks.
+    weighted_t = np.ascontiguousarray((scores * weights).T, dtype=np.float32)  # (n_domains, n_items)
+    rank_values = np.arange(1, n_items + 1, dtype=ranks.dtype)[None, :]  # 1 = best
+
+    def kernel(rows, rng):
+        # U(1 - wpert, 1 + wpert) multipliers in float32
+        pert = rng.random((rows.stop - rows.start, n_domains), dtype=np.float32)
+        pert *= np.float32(2 * wpert)
+        pert += np.float32(1 - wpert)
+        ws = pert @ weighted_t  # (chunk, n_items), proportional to weighted scores
+        order = ws.argsort(axis=1)[:, ::-1]  # descending scores
+        # Invert every permutation at once: scatter positions back to items
+        np.put_along_axis(ranks[rows], order, rank_values, axis=1)
+        # Top-k hits straight from the leading order columns, so the summary
+        # needs no (r, n_items) boolean comparisons
+        counts = top_counts[rows.start // MC_CHUNK]
+        counts[0] = np.bincount(order[:, 0], minlength=n_items)
+        counts[1] = np.bincount(order[:, :3].ravel(), minlength=n_items)
+
+    return kernel
+
+
+def _empty_ranks(r: int, n_items: int) -> tuple[np.ndarray, np.ndarray]:
+    """Allocate the (r, n_items) rank matrix and per-chunk top-k counters"""
+    # Ranks fit in int16 for any realistic item count (4x smaller than intp)
+    ranks = np.empty((r, n_items), dtype=np.promote_types(np.min_scalar_type(n_items), np.int16))
+    top_counts = np.zeros((-(-r // MC_CHUNK), 2, n_items), dtype=np.int64)
+    return ranks, top_counts
+
+
+def _score_summary(ws: np.ndarray):
+    """Mean and 95% interval of replicate weighted scores"""
+    mean = ws.mean(axis=0, dtype=np.float64)
+    lo, hi = np.percentile(ws, [2.5, 97.5], axis=0).astype(float)
     return mean, lo, hi
 
 
-def robustness_weights(scores: np.ndarray, weights: np.ndarray, r: int, wpert: float, seed: int):
-    """Monte Carlo analysis for weight sensitivity"""
-    rng = np.random.default_rng(seed)
-    n_items, n_domains = scores.shape
-    pert = rng.uniform(1 - wpert, 1 + wpert, size=(r, n_domains)) * weights.reshape(1, -1)
-    pert /= pert.sum(axis=1, keepdims=True)
-    ws = pert @ scores.T  # (r, n_items)
-    order = ws.argsort(axis=1)[:, ::-1]  # descending scores
-    ranks = np.empty_like(order)
-    for i in range(r):
-        perm = order[i]
-        inv = np.empty_like(perm)
-        inv[perm] = np.arange(1, n_items + 1)  # 1 = best
-        ranks[i] = inv
+def _rank_summary(scores: np.ndarray, weights: np.ndarray, ranks: np.ndarray,
+                  top_counts: np.ndarray) -> dict[str, np.ndarray]:
+    """Rank statistics across weight-perturbation replicates"""
+    rank_lo, rank_hi = np.percentile(ranks, [2.5, 97.5], axis=0)
+    top1, top3 = top_counts.sum(axis=0) / ranks.shape[0]
     return {
         "base_score": (scores * weights).sum(axis=1),
         "rank_mean": ranks.mean(axis=0),
-        "rank_lo": np.percentile(ranks, 2.5, axis=0),
-        "rank_hi": np.percentile(ranks, 97.5, axis=0),
-        "p_top1": (ranks == 1).mean(axis=0),
-        "p_top3": (ranks <= 3).mean(axis=0),
+        "rank_lo": rank_lo,
+        "rank_hi": rank_hi,
+        "p_top1": top1,
+        "p_top3": top3,
     }
 
 
-def main():
+def mc_score_intervals(scores: np.ndarray, weights: np.ndarray, r: int, noise: float, seed: int,
+                       n_jobs: int = 1):
+    """Monte Carlo analysis for score uncertainty"""
+    # Replicates are drawn in chunks so only a (chunk, n_items, n_domains)
+    # cube is alive at a time; the (r, n_items) weighted scores are kept.
+    ws = np.empty((r, scores.shape[0]), dtype=np.float32)
+    run_chunks([(_score_kernel(scores, weights, noise, ws), seed)], r, n_jobs)
+    return _score_summary(ws)
+
+
+def robustness_weights(scores: np.ndarray, weights: np.ndarray, r: int, wpert: float, seed: int,
+                       n_jobs: int = 1):
+    """Monte Carlo analysis for weight sensitivity"""
+    ranks, top_counts = _empty_ranks(r, scores.shape[0])
+    run_chunks([(_weight_kernel(scores, weights, wpert, ranks, top_counts), seed)], r, n_jobs)
+    return _rank_summary(scores, weights, ranks, top_counts)
+
+
+def mc_combined(scores: np.ndarray, weights: np.ndarray, r: int, noise: float, wpert: float,
+                seed_scores: int, seed_weights: int, n_jobs: int = 1):
+    """
+    Run score-uncertainty and weight-robustness analyses in one pass.
+
+    Both kernels are applied to each replicate chunk in turn, sharing one
+    thread pool and chunk schedule. Results equal those of
+    ``mc_score_intervals`` and ``robustness_weights`` with the same seeds.
+
+    Returns
+    -------
+    ((mean, lo, hi), dict)
+        Score intervals and rank-robustness statistics
+    """
+    ws = np.empty((r, scores.shape[0]), dtype=np.float32)
+    ranks, top_counts = _empty_ranks(r, scores.shape[0])
+    run_chunks(
+        [
+            (_score_kernel(scores, weights, noise, ws), seed_scores),
+            (_weight_kernel(scores, weights, wpert, ranks, top_counts), seed_weights),
+        ],
+        r, n_jobs,
+    )
+    return _score_summary(ws), _rank_summary(scores, weights, ranks, top_counts)
+
+
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description='Enhanced MC analysis with integrated data preparation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -288,9 +455,11 @@ Examples:
                    help="Random seed for score jitter (default: 42)")
     ap.add_argument("--seed_weights", type=int, default=123,
                    help="Random seed for weight perturbation (default: 123)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                   help="Worker threads for Monte Carlo chunks (default: all cores)")
     ap.add_argument("-o", "--outdir", type=Path, default=Path("."),
                    help="Output directory (default: current directory)")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     print("\n" + "=" * 70)
     print("ENHANCED MC ANALYSIS WITH DATA PREPARATION")
@@ -300,6 +469,7 @@ Examples:
     print(f"MC iterations:   {args.replicates:,}")
     print(f"Score noise:     ±{args.noise}")
     print(f"Weight perturb:  ±{args.wpert * 100}%")
+    print(f"Worker threads:  {args.jobs}")
     print(f"Output dir:      {args.outdir}")
     
     # Create output directory
@@ -310,7 +480,7 @@ Examples:
     print("STEP 1: Loading and parsing input data")
     print("=" * 70)
     
-    df = pd.read_excel(args.input, sheet_name=args.sheet)
+    df = read_scores_sheet(args.input, args.sheet)
     print(f"✓ Loaded {len(df)} interventions from {args.input}")
     
     domain_cols, weights, scores, items = parse_weights_and_scores(df)
@@ -341,17 +511,26 @@ Examples:
     
     # Save enriched dataset
     enriched_path = args.outdir / 'Intervention_list_&_scores.xlsx'
-    df_enriched.to_excel(enriched_path, sheet_name='Sheet1', index=False)
+    write_enriched_workbook(df_enriched, enriched_path)
     print(f"\n✓ Saved enriched dataset: {enriched_path}")
     print(f"  {len(df_enriched)} rows × {len(df_enriched.columns)} columns")
 
+    # Both Monte Carlo analyses share one pass over replicate chunks
+    print("\n" + "=" * 70)
+    print("MONTE CARLO: Score uncertainty + weight robustness")
+    print("=" * 70)
+    print(f"Running {args.replicates:,} iterations with ±{args.noise} noise "
+          f"and ±{args.wpert*100}% weight perturbation...")
+    (mean, lo, hi), rb = mc_combined(
+        scores, weights, args.replicates, args.noise, args.wpert,
+        args.seed_scores, args.seed_weights, n_jobs=args.jobs,
+    )
+
     # STEP 3: Monte Carlo score intervals
     print("\n" + "=" * 70)
     print("STEP 3: Monte Carlo analysis - Score uncertainty")
     print("=" * 70)
-    print(f"Running {args.replicates:,} iterations with ±{args.noise} noise...")
     
-    mean, lo, hi = mc_score_intervals(scores, weights, args.replicates, args.noise, args.seed_scores)
     score_ci = (
         pd.DataFrame({
             "Intervention": items,
@@ -364,12 +543,12 @@ Examples:
     )
     
     intervals_path = args.outdir / "weighted_score_intervals.csv"
-    intervals_path.write_text(score_ci.to_csv(index=False), encoding="utf-8")
+    score_ci.to_csv(intervals_path, index=False, encoding="utf-8", lineterminator="\n")
     print(f"✓ Saved score intervals: {intervals_path}")
     
     # Show top 5
     print(f"\nTop 5 interventions (mean weighted score):")
-    for i, row in score_ci.head(5).iterrows():
+    for i, row in enumerate(score_ci.head(5).to_dict("records")):
         print(f"  {i+1}. {row['Intervention']}: "
               f"{row['WeightedScore_Mean']:.2f} "
               f"[{row['WeightedScore_P2_5']:.2f}, {row['WeightedScore_P97_5']:.2f}]")
@@ -378,9 +557,7 @@ Examples:
     print("\n" + "=" * 70)
     print("STEP 4: Monte Carlo analysis - Weight robustness")
     print("=" * 70)
-    print(f"Running {args.replicates:,} iterations with ±{args.wpert*100}% weight perturbation...")
     
-    rb = robustness_weights(scores, weights, args.replicates, args.wpert, args.seed_weights)
     rank_robust = (
         pd.DataFrame({
             "Intervention": items,
@@ -396,12 +573,12 @@ Examples:
     )
     
     robustness_path = args.outdir / "ranking_robustness_weights_p5.csv"
-    robustness_path.write_text(rank_robust.to_csv(index=False), encoding="utf-8")
+    rank_robust.to_csv(robustness_path, index=False, encoding="utf-8", lineterminator="\n")
     print(f"✓ Saved ranking robustness: {robustness_path}")
     
     # Show top 5 most stable rankings
     print(f"\nTop 5 most stable rankings:")
-    for i, row in rank_robust.head(5).iterrows():
+    for i, row in enumerate(rank_robust.head(5).to_dict("records")):
         print(f"  {i+1}. {row['Intervention']}: "
               f"rank {row['MeanRank_Weights_p5']:.1f} "
               f"[{row['Rank_P2_5']:.0f}, {row['Rank_P97_5']:.0f}], "
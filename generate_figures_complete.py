@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 """
 Complete script to generate all 8 figures
-Generates both TIFF and EPS formats at 300 DPI
+Generates TIFF (300 DPI) and PDF formats; EPS on request (--eps)
 """
 
-import matplotlib.pyplot as plt
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')  # headless rendering, also in worker processes
 import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle, FancyBboxPatch, FancyArrowPatch
+from matplotlib.ticker import FuncFormatter
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -15,7 +26,7 @@ warnings.filterwarnings('ignore')
 W_2COL_IN = 7.2  # 2-column width in inches (183 mm)
 
 # Set publication-quality defaults
-plt.rcParams.update({
+matplotlib.rcParams.update({
     'font.family': 'sans-serif',
     'font.sans-serif': ['Helvetica', 'Arial', 'DejaVu Sans', 'Liberation Sans'],
     'font.size': 12,
@@ -31,32 +42,105 @@ plt.rcParams.update({
     'savefig.pad_inches': 0.1
 })
 
-def save_figure(fig, filename):
-    """Save figure in both TIFF and EPS formats"""
-    # Save as TIFF (300 DPI) with LZW compression
-    fig.savefig(f"{filename}.tiff", format='tiff', dpi=300, pil_kwargs={"compression": "tiff_lzw"})
-    # Save as EPS (vector format)
-    fig.savefig(f"{filename}.eps", format='eps', dpi=300)
-    print(f"Saved: {filename}.tiff and {filename}.eps")
-
-def create_figure1():
+def read_excel_sheet(path, sheet):
+    """Read one worksheet, preferring the calamine engine over openpyxl"""
+    try:
+        xl = pd.ExcelFile(path, engine='calamine')
+    except (ImportError, ValueError):  # no python-calamine, or pandas < 2.2
+        xl = pd.ExcelFile(path)
+    with xl:
+        return xl.parse(sheet)
+
+# Intervention categories by mechanism type (Figure 4)
+CATEGORY_MEMBERS = {
+    'Pharmacological': [
+        'Rapamycin', 'Metformin', 'Acarbose', 'GLP-1 agonists',
+        'SGLT2 inhibitors', 'Alpha-ketoglutarate', 'Senolytics (D+Q)',
+        'Fisetin', 'NAD+ Restoration (NMN/NR)', 'Mitochondria (Urolithin A)',
+        'Elamipretide', 'Spermidine', 'Chloroquine', 'Glutathione Precursors',
+        'L-deprenyl', '17α-estradiol'
+    ],
+    'Genetic & Epigenetic': [
+        'Epigenetic reprogramming', 'Gene therapy',
+        'Proteostasis & Nucleolus', 'Telomere extension'
+    ],
+    'Cellular & Regenerative': [
+        'Stem cell therapy', 'Exosome therapy', 'Chemical reprogramming',
+        'Synthetic organs', 'Immunotherapy senolytics', 'Xenotransplantation'
+    ],
+    'Systemic & Other': [
+        'Gut Microbiome Modulation', 'Anti-inflammatory',
+        'Plasma dilution/apheresis', 'Young blood plasma'
+    ],
+}
+
+# Flat name -> category lookup
+CATEGORY_MAP = {
+    name: category
+    for category, names in CATEGORY_MEMBERS.items()
+    for name in names
+}
+
+# Published source data for Figures 1-3, converted to arrays once at import
+# Figure 1: relative mortality risk ratios
+RISK_RATIOS = np.array([13.8, 1.8, 1.45, 1.28, 1.28, 1.11])
+# Figure 2: deaths per 100,000 by leading cause, age <65 and ≥65
+UNDER_65_RATES = np.array([45.9, 55.1, 7.9, 7.2, 0.5, 9.7, 3.6])
+OVER_65_RATES = np.array([935.7, 778.7, 237.7, 212.0, 190.0, 115.7, 76.3])
+# Figure 3: US deaths per 100,000 by age group
+AGE_DEATH_RATES = np.array([15, 77, 148, 237, 412, 899, 1809, 4345, 14286], dtype=np.float64)
+
+def new_figure(figsize):
+    """Create a figure on its own Agg canvas, outside pyplot's figure registry"""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+# Default output formats for individual figures; main() adds 'eps' when requested
+SAVE_FORMATS = ('tiff', 'pdf')
+
+def _save_tiff(fig, path, dpi=300):
+    """Write an LZW-compressed TIFF through the Agg canvas and Pillow"""
+    fig.savefig(str(path), format='tiff', dpi=dpi, pil_kwargs={"compression": "tiff_lzw"})
+
+def save_figure(fig, filename, output_dir='.', formats=SAVE_FORMATS):
+    """Save figure to output_dir as TIFF plus vector PDF (and EPS if listed in formats)
+
+    Returns the paths written.
+    """
+    output_dir = Path(output_dir)
+    paths = []
+    if 'tiff' in formats:
+        # Save as TIFF (300 DPI) with LZW compression
+        paths.append(output_dir / f"{filename}.tiff")
+        _save_tiff(fig, paths[-1])
+    if 'pdf' in formats:
+        # Save as PDF (compressed vector format)
+        paths.append(output_dir / f"{filename}.pdf")
+        fig.savefig(paths[-1], format='pdf', dpi=300)
+    if 'eps' in formats:
+        # Save as EPS (uncompressed vector format, slow for dense figures)
+        paths.append(output_dir / f"{filename}.eps")
+        fig.savefig(paths[-1], format='eps', dpi=300)
+    print("Saved: " + " and ".join(p.name for p in paths))
+    return paths
+
+def create_figure1(output_dir='.', formats=SAVE_FORMATS):
     """Figure 1: Comparative Mortality Risk Factors"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = new_figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     
     risk_factors = ['Age ≥65 vs. <65', 'Heavy Smoking', 'Obesity\n(BMI ≥30)', 
                    'Physical\nInactivity', 'Hypertension\n(per 20 mmHg)', 
                    'Air Pollution\n(PM2.5 +10 μg/m³)']
-    risk_ratios = [13.8, 1.8, 1.45, 1.28, 1.28, 1.11]
     colors = ['purple', 'red', 'orange', 'green', 'blue', 'gray']
     
-    bars = ax.bar(risk_factors, risk_ratios, color=colors, alpha=0.8, 
+    bars = ax.bar(risk_factors, RISK_RATIOS, color=colors, alpha=0.8, 
                   edgecolor='black', linewidth=1)
     
     # Add value labels on bars
-    for bar, value in zip(bars, risk_ratios):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.2,
-                f'{value}×', ha='center', va='bottom', fontweight='bold', fontsize=12)
+    ax.bar_label(bars, labels=[f'{v}×' for v in RISK_RATIOS], padding=5,
+                 fontweight='bold', fontsize=12)
     
     ax.set_ylabel('Relative Risk Ratio (×)', fontweight='bold')
     ax.set_xlabel('Risk Factors', fontweight='bold')
@@ -64,38 +148,29 @@ def create_figure1():
     ax.grid(axis='y', alpha=0.3)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
-    plt.xticks(rotation=0)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=0)
+    fig.tight_layout()
     
-    save_figure(fig, "Figure1_Mortality_Risk_Factors")
-    plt.close()
+    return save_figure(fig, "Figure1_Mortality_Risk_Factors", output_dir, formats)
 
-def create_figure2():
+def create_figure2(output_dir='.', formats=SAVE_FORMATS):
     """Figure 2: Age-Stratified Mortality Rates by Leading Cause of Death"""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = new_figure(figsize=(12, 7))
+    ax = fig.add_subplot()
     
     causes = ['Heart\ndisease', 'Cancer', 'Stroke', 'COPD', "Alzheimer's", 'Diabetes', 'Kidney\ndisease']
-    under_65 = [45.9, 55.1, 7.9, 7.2, 0.5, 9.7, 3.6]
-    over_65 = [935.7, 778.7, 237.7, 212.0, 190.0, 115.7, 76.3]
     
     x = np.arange(len(causes))
     width = 0.35
     
-    bars1 = ax.bar(x - width/2, under_65, width, label='Age <65', 
+    bars1 = ax.bar(x - width/2, UNDER_65_RATES, width, label='Age <65', 
                    color='#3498db', alpha=0.85, edgecolor='black', linewidth=1)
-    bars2 = ax.bar(x + width/2, over_65, width, label='Age ≥65', 
+    bars2 = ax.bar(x + width/2, OVER_65_RATES, width, label='Age ≥65', 
                    color='#e74c3c', alpha=0.85, edgecolor='black', linewidth=1)
     
     # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{height:.1f}', ha='center', va='bottom', fontsize=9)
-    
-    for bar in bars2:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 20,
-                f'{height:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    ax.bar_label(bars1, fmt='{:.1f}', padding=1, fontsize=9)
+    ax.bar_label(bars2, fmt='{:.1f}', padding=9, fontsize=9, fontweight='bold')
     
     ax.set_ylabel('Death Rate (per 100,000 population)', fontweight='bold', fontsize=14)
     ax.set_xlabel('Cause of Death', fontweight='bold', fontsize=14)
@@ -107,27 +182,23 @@ def create_figure2():
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    save_figure(fig, "Figure2_Age_Stratified_Mortality")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure2_Age_Stratified_Mortality", output_dir, formats)
 
-def create_figure3():
+def create_figure3(output_dir='.', formats=SAVE_FORMATS):
     """Figure 3: US Mortality Rates by Age Group"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = new_figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     
     age_groups = ['5-14', '15-24', '25-34', '35-44', '45-54', '55-64', '65-74', '75-84', '85+']
-    death_rates = [15, 77, 148, 237, 412, 899, 1809, 4345, 14286]
     
     # Color gradient from blue to red
-    colors = plt.cm.coolwarm(np.linspace(0, 1, len(age_groups)))
+    colors = matplotlib.colormaps['coolwarm'](np.linspace(0, 1, len(age_groups)))
     
-    bars = ax.bar(age_groups, death_rates, color=colors, edgecolor='black', linewidth=1)
+    bars = ax.bar(age_groups, AGE_DEATH_RATES, color=colors, edgecolor='black', linewidth=1)
     
     # Add value labels
-    for bar, value in zip(bars, death_rates):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 200,
-                f'{value:,}', ha='center', va='bottom', fontweight='bold', fontsize=10)
+    ax.bar_label(bars, fmt='{:,.0f}', padding=4, fontweight='bold', fontsize=10)
     
     ax.set_ylabel('Death Rate per 100,000 Population', fontweight='bold')
     ax.set_xlabel('Age Group (years)', fontweight='bold')
@@ -137,49 +208,53 @@ def create_figure3():
     ax.spines['right'].set_visible(False)
     
     # Format y-axis with commas
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x:,.0f}'))
     
-    plt.tight_layout()
-    save_figure(fig, "Figure3_US_Mortality_by_Age")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure3_US_Mortality_by_Age", output_dir, formats)
+
+def _resolve_label_overlaps(x0, y0, x1, y1, ys, dy, ymin, ymax):
+    """
+    One collision-avoidance pass over label bounding boxes.
+
+    Every overlapping pair (i < j) of display-space boxes is pushed apart
+    by ``dy`` in data space, lower label down and upper label up, clamped
+    to ``[ymin, ymax]``. ``ys`` is updated in place. Pure array code with
+    no matplotlib calls.
+
+    Returns
+    -------
+    bool
+        True if any label moved
+    """
+    # Pairwise bbox overlap test for all label pairs at once
+    overlap = ((x0[:, None] < x1[None, :]) & (x1[:, None] > x0[None, :]) &
+               (y0[:, None] < y1[None, :]) & (y1[:, None] > y0[None, :]))
+    pairs = np.argwhere(np.triu(overlap, 1))
+    for i, j in pairs:
+        yi, yj = ys[i], ys[j]
+        if yi <= yj:
+            new_yi, new_yj = yi - dy, yj + dy
+        else:
+            new_yi, new_yj = yi + dy, yj - dy
+        # Keep within bounds
+        ys[i] = min(max(new_yi, ymin), ymax)
+        ys[j] = min(max(new_yj, ymin), ymax)
+    return len(pairs) > 0
+
 
-def create_figure4(excel_data):
+def create_figure4(excel_data, output_dir='.', formats=SAVE_FORMATS):
     """Figure 4: Translational Readiness vs Potential Impact - Exact Format Match"""
     
     # Extract data from Excel file
     df = excel_data.copy()
     
-    # Define categories based on intervention characteristics
-    def categorize_intervention(name):
-        pharmacological = ['Rapamycin', 'Metformin', 'Acarbose', 'GLP-1 agonists', 
-                          'SGLT2 inhibitors', 'Alpha-ketoglutarate', 'Senolytics (D+Q)',
-                          'Fisetin', 'NAD+ Restoration (NMN/NR)', 'Mitochondria (Urolithin A)',
-                          'Elamipretide', 'Spermidine', 'Chloroquine', 'Glutathione Precursors',
-                          'L-deprenyl', '17α-estradiol']
-        
-        genetic = ['Epigenetic reprogramming', 'Gene therapy',
-                  'Proteostasis & Nucleolus', 'Telomere extension']
-        
-        cellular = ['Stem cell therapy', 'Exosome therapy', 'Chemical reprogramming',
-                   'Synthetic organs','Immunotherapy senolytics', 'Xenotransplantation']
-        
-        systemic = ['Gut Microbiome Modulation','Anti-inflammatory','Plasma dilution/apheresis', 'Young blood plasma']
-        
-        if name in pharmacological:
-            return 'Pharmacological'
-        elif name in genetic:
-            return 'Genetic & Epigenetic'
-        elif name in cellular:
-            return 'Cellular & Regenerative'
-        elif name in systemic:
-            return 'Systemic & Other'
-        else:
-            return 'Other'
-    
-    df['Category'] = df['Intervention'].apply(categorize_intervention)
+    # Assign categories by mechanism type
+    df['Category'] = df['Intervention'].map(CATEGORY_MAP).fillna('Other')
     
     # Create figure with exact dimensions
-    fig, ax = plt.subplots(figsize=(12, 9))
+    fig = new_figure(figsize=(12, 9))
+    ax = fig.add_subplot()
     
     category_colors = {
         'Pharmacological': '#1f77b4',
@@ -188,31 +263,34 @@ def create_figure4(excel_data):
         'Systemic & Other': '#ff7f0e'
     }
     
-    # Plot points and collect text labels
+    # Plot all points as one collection, then collect text labels
+    readiness = df['Translational_Readiness'].to_numpy()
+    impact = df['Aging_Impact'].to_numpy()
+    ax.scatter(
+        readiness,
+        impact,
+        c=df['Category'].map(category_colors).fillna('gray').tolist(),
+        s=64,  # markersize 8
+        marker='o',
+        edgecolors='face',
+        linewidths=1,
+        zorder=2,  # above the gridlines, like the per-point Line2D markers
+        rasterized=True,
+    )
     texts = []
     text_to_intervention = {}  # Map text objects to (intervention_name, original_y)
-    for _, row in df.iterrows():
-        color = category_colors.get(row['Category'], 'gray')
-        ax.plot(
-            row['Translational_Readiness'],
-            row['Aging_Impact'],
-            marker='o',
-            markersize=8,
-            linestyle='',
-            color=color,
-        )
+    for x, original_y, name in zip(readiness, impact, df['Intervention']):
         # Add text label with initial position offset to the right
-        original_y = row['Aging_Impact']
         t = ax.text(
-            row['Translational_Readiness'] + 0.06,
+            x + 0.06,
             original_y,
-            row['Intervention'],
+            name,
             fontsize=12,
             va='center',
             ha='left',
         )
         texts.append(t)
-        text_to_intervention[t] = (row['Intervention'], original_y)
+        text_to_intervention[t] = (name, original_y)
     
     # Set exact axis limits
     ax.set_xlim(1, 5.5)
@@ -234,7 +312,7 @@ def create_figure4(excel_data):
     ax.set_ylabel('Potential for Aging Impact (1 = Low, 5 = High)', fontsize=14)
     
     # Create legend
-    handles = [plt.Line2D([0], [0], marker='o', color='w', 
+    handles = [Line2D([0], [0], marker='o', color='w', 
                          markerfacecolor=c, markersize=8, label=cat)
                for cat, c in category_colors.items()]
     # Position legend
@@ -242,31 +320,27 @@ def create_figure4(excel_data):
               title='', frameon=True, fontsize=14)
     
     # Smart collision-avoidance with bounds checking
+    # Labels only move vertically, so their boxes are measured with a single
+    # draw and then translated analytically instead of redrawn every pass.
     fig.canvas.draw()
     ymin, ymax = 2, 5.5
+    # Data-space step for a 2-pixel nudge; the axes transform is fixed here
+    _, dy = ax.transData.inverted().transform((0, 2)) - ax.transData.inverted().transform((0, 0))
+    display_per_data_y = ax.transData.transform((0, 1))[1] - ax.transData.transform((0, 0))[1]
+    renderer = fig.canvas.get_renderer()
+    x0, y0, x1, y1 = np.array([txt.get_window_extent(renderer).expanded(1.02, 1.05).extents
+                               for txt in texts]).T.copy()
+    xs = np.array([txt.get_position()[0] for txt in texts])
+    ys = np.array([txt.get_position()[1] for txt in texts], dtype=float)
     for iteration in range(400):
-        moved = False
-        renderer = fig.canvas.get_renderer()
-        bboxes = [txt.get_window_extent(renderer).expanded(1.02, 1.05) for txt in texts]
-        for i in range(len(texts)):
-            for j in range(i + 1, len(texts)):
-                if bboxes[i].overlaps(bboxes[j]):
-                    _, dy = ax.transData.inverted().transform((0, 2)) - ax.transData.inverted().transform((0, 0))
-                    yi = texts[i].get_position()[1]
-                    yj = texts[j].get_position()[1]
-                    if yi <= yj:
-                        new_yi, new_yj = yi - dy, yj + dy
-                    else:
-                        new_yi, new_yj = yi + dy, yj - dy
-                    # Keep within bounds
-                    new_yi = min(max(new_yi, ymin), ymax)
-                    new_yj = min(max(new_yj, ymin), ymax)
-                    texts[i].set_position((texts[i].get_position()[0], new_yi))
-                    texts[j].set_position((texts[j].get_position()[0], new_yj))
-                    moved = True
-        if not moved:
+        prev_ys = ys.copy()
+        if not _resolve_label_overlaps(x0, y0, x1, y1, ys, dy, ymin, ymax):
             break
-        fig.canvas.draw()
+        shift = (ys - prev_ys) * display_per_data_y
+        y0 += shift
+        y1 += shift
+    for txt, x, y in zip(texts, xs, ys):
+        txt.set_position((x, y))
 
     # Force Chemical reprogramming and Exosome therapy to align with their bullets
     for txt in texts:
@@ -275,18 +349,17 @@ def create_figure4(excel_data):
             current_x = txt.get_position()[0]
             txt.set_position((current_x, original_y))
 
-    plt.tight_layout()
-    save_figure(fig, "Figure4_Readiness_vs_Impact")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure4_Readiness_vs_Impact", output_dir, formats)
 
-def create_figure5(intervals_data):
+def create_figure5(intervals_data, output_dir='.', formats=SAVE_FORMATS):
     """Figure 5: Rank Stability Analysis"""
     
     # Load data and get top 15 interventions
-    df = intervals_data.copy()
-    df = df.head(15)  # Top 15 interventions
+    df = intervals_data.nlargest(15, 'WeightedScore_Mean')  # Top 15 interventions
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = new_figure(figsize=(14, 7))
+    ax = fig.add_subplot()
     
     interventions = df['Intervention'].values
     baseline_scores = df['WeightedScore_Mean'].values
@@ -295,7 +368,7 @@ def create_figure5(intervals_data):
     
     x_pos = range(len(interventions))
     ax.scatter(x_pos, baseline_scores, color='steelblue', s=100, zorder=3, 
-              edgecolors='black', linewidth=1.5)
+              edgecolors='black', linewidth=1.5, rasterized=True)
     ax.errorbar(x_pos, baseline_scores, 
                 yerr=[baseline_scores - ci_lower, ci_upper - baseline_scores],
                 fmt='none', color='steelblue', capsize=5, capthick=2, linewidth=2, zorder=2)
@@ -309,61 +382,63 @@ def create_figure5(intervals_data):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    save_figure(fig, "Figure5_Rank_Stability")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure5_Rank_Stability", output_dir, formats)
 
-def create_figure6(excel_data):
+def create_figure6(excel_data, output_dir='.', formats=SAVE_FORMATS):
     """Figure 6: Domain-wise Contribution Profiles"""
     
     # Get top 15 interventions by weighted score
-    df = excel_data.copy()
-    df = df.sort_values('Weighted score', ascending=False).head(15)
+    df = excel_data.nlargest(15, 'Weighted score')
     
     interventions = df['Intervention'].values
     
     # Extract domain contributions (normalized to weighted contributions)
-    domains = {
-        'Preclinical Lifespan (30%)': df['Lifespan (30%)'].values * 0.3,
-        'Preclinical Healthspan (10%)': df['Healthspan (10%)'].values * 0.1,
-        'Mechanism Conservation (10%)': df['Conservation (10%)'].values * 0.1,
-        'Human Trial Evidence (20%)': df['Human Trials (20%)'].values * 0.2,
-        'Safety & Tolerability (20%)': df['Safety & Tolerability (20%)'].values * 0.2,
-        'Cost & Accessibility (10%)': df['Cost/Access (10%)'].values * 0.1
-    }
+    domain_cols = ['Lifespan (30%)', 'Healthspan (10%)', 'Conservation (10%)',
+                   'Human Trials (20%)', 'Safety & Tolerability (20%)', 'Cost/Access (10%)']
+    domain_labels = ['Preclinical Lifespan (30%)', 'Preclinical Healthspan (10%)',
+                     'Mechanism Conservation (10%)', 'Human Trial Evidence (20%)',
+                     'Safety & Tolerability (20%)', 'Cost & Accessibility (10%)']
+    domain_weights = np.array([0.3, 0.1, 0.1, 0.2, 0.2, 0.1])
+    contrib = df[domain_cols].to_numpy(dtype=float) * domain_weights  # (n_items, n_domains)
+    # Stack bottoms: running total of the preceding domains
+    bottoms = np.zeros_like(contrib)
+    np.cumsum(contrib[:, :-1], axis=1, out=bottoms[:, 1:])
+    
+    fig = new_figure(figsize=(15, 8))
+    ax = fig.add_subplot()
     
-    fig, ax = plt.subplots(figsize=(15, 8))
-    
-    bottom = np.zeros(len(interventions))
     colors = ['#ff6384', '#36a2eb', '#ffce56', '#4bc0c0', '#9966ff', '#ff9f40']
     
-    for i, (domain, values) in enumerate(domains.items()):
-        ax.bar(interventions, values, bottom=bottom, label=domain, 
-               color=colors[i], alpha=0.85, edgecolor='black', linewidth=0.5)
-        bottom += values
+    for i, domain in enumerate(domain_labels):
+        # Rasterized in vector output; axes and text stay vector
+        ax.bar(interventions, contrib[:, i], bottom=bottoms[:, i], label=domain, 
+               color=colors[i], alpha=0.85, edgecolor='black', linewidth=0.5,
+               rasterized=True)
     
     ax.set_ylabel('Weighted Score Contribution', fontweight='bold', fontsize=14)
     ax.set_xlabel('Geroscience Interventions (ranked by total weighted score)', 
                  fontweight='bold', fontsize=14)
     ax.set_ylim(0, 4.0)
-    plt.xticks(rotation=45, ha='right')
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right')
     ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', frameon=True, fontsize=10)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
-    plt.tight_layout()
-    save_figure(fig, "Figure6_Domain_Contributions")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure6_Domain_Contributions", output_dir, formats)
 
-def create_figure7(excel_data):
+def create_figure7(excel_data, output_dir='.', formats=SAVE_FORMATS):
     """Figure 7: Stakeholder Sensitivity Analysis"""
     
     # Select interventions that show most variation across stakeholder perspectives
     df = excel_data.copy()
     
     # Calculate variation in ranks across stakeholder perspectives
-    df['rank_variance'] = df[['Regulator rank', 'Investor rank', 'Patient rank']].var(axis=1)
+    rank_cols = df[['Regulator rank', 'Investor rank', 'Patient rank']].to_numpy(dtype=float)
+    df['rank_variance'] = rank_cols.var(axis=1, ddof=1)
     
     # Select top 12 interventions with highest variation
     df_selected = df.nlargest(12, 'rank_variance')
@@ -383,13 +458,15 @@ def create_figure7(excel_data):
     x = np.arange(len(interventions))
     width = 0.2
     
-    fig, ax = plt.subplots(figsize=(15, 8))
+    fig = new_figure(figsize=(15, 8))
+    ax = fig.add_subplot()
     
     colors = ['steelblue', 'forestgreen', 'darkorange', 'crimson']
     
     for i, (stakeholder, scores) in enumerate(stakeholder_data.items()):
-        bars = ax.bar(x + i*width, scores, width, label=stakeholder, 
-                     color=colors[i], alpha=0.85, edgecolor='black', linewidth=0.5)
+        ax.bar(x + i*width, scores, width, label=stakeholder, 
+               color=colors[i], alpha=0.85, edgecolor='black', linewidth=0.5,
+               rasterized=True)
     
     ax.set_ylabel('Weighted Score', fontweight='bold', fontsize=14)
     ax.set_xlabel('Geroscience Interventions (ordered by stakeholder sensitivity)', 
@@ -402,13 +479,13 @@ def create_figure7(excel_data):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    save_figure(fig, "Figure7_Stakeholder_Sensitivity")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure7_Stakeholder_Sensitivity", output_dir, formats)
 
-def create_figure8():
+def create_figure8(output_dir='.', formats=SAVE_FORMATS):
     """Figure 8: MCDA Framework Flowchart"""
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig = new_figure(figsize=(10, 10))
+    ax = fig.add_subplot()
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 16)
     ax.axis('off')
@@ -554,25 +631,35 @@ def create_figure8():
     for i, text in enumerate(methodology_text):
         ax.text(0.7, 1.85 - i * 0.35, text, ha='left', va='top', fontsize=7, color='#555')
     
-    plt.tight_layout()
-    save_figure(fig, "Figure8_MCDA_Framework")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(fig, "Figure8_MCDA_Framework", output_dir, formats)
+
+def _load_panel(path, size):
+    """Load a panel image as uint8 RGB, downsampled to fit ``size`` (width, height)."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.thumbnail(size, Image.Resampling.BILINEAR)
+        # Opaque panels: plain uint8 RGB, no alpha plane or float copy
+        return np.asarray(img.convert('RGB'), dtype=np.uint8)
+
 
 def create_multipanel_a_to_h(
     fig_stems=None,
     out_stem="Figure9_Multipanel_a-h",
     layout=(4, 2),  # rows, cols
+    panel_dir=None,
 ):
     """
     Combine Figures 1–8 into a single multi-panel layout with panel letters (a–h).
     - Panel letters: 8 pt bold, top-left of each panel.
-    - Output: PDF + TIFF (300 dpi) + PNG preview
+    - Panels are read from panel_dir (default: current working directory).
+    - Output: PDF + TIFF (300 dpi) + PNG preview in panel_dir; returns their paths
     """
-    import matplotlib.image as mpimg
     from pathlib import Path
+    from PIL import Image
 
-    # Resolve working directory (same folder as this script)
-    here = Path.cwd()  # Use current working directory
+    here = Path.cwd() if panel_dir is None else Path(panel_dir)
 
     # Default stems in intended order (a–h)
     if fig_stems is None:
@@ -587,20 +674,15 @@ def create_multipanel_a_to_h(
             "Figure8_MCDA_Framework",
         ]
 
-    # Load panel images (TIFF preferred)
-    imgs = []
+    # Locate panel images (TIFF preferred)
+    paths = []
     missing = []
     for stem in fig_stems:
         p = here / f"{stem}.tiff"
-        if not p.exists():
-            # allow running from elsewhere (e.g., /mnt/data)
-            alt = Path("/mnt/data") / f"{stem}.tiff"
-            if alt.exists():
-                p = alt
-            else:
-                missing.append(stem)
-                continue
-        imgs.append(mpimg.imread(str(p)))
+        if p.exists():
+            paths.append(p)
+        else:
+            missing.append(stem)
 
     if missing:
         raise FileNotFoundError(
@@ -609,32 +691,50 @@ def create_multipanel_a_to_h(
         )
 
     rows, cols = layout
-    assert rows * cols >= len(imgs), "Layout grid too small for number of panels."
+    assert rows * cols >= len(paths), "Layout grid too small for number of panels."
 
     # Width: 2-column (183 mm). Height chosen to keep panels readable.
     fig_w = W_2COL_IN
     fig_h = 11.5  # inches; increased to accommodate caption
 
-    fig = plt.figure(figsize=(fig_w, fig_h))
+    fig = new_figure(figsize=(fig_w, fig_h))
     gs = fig.add_gridspec(rows, cols, left=0.02, right=0.98, top=0.90, bottom=0.12, wspace=0.04, hspace=0.08)
 
+    # Grid cells in figure fractions; panel size in output pixels (300 dpi)
+    bottoms, tops, lefts, rights = gs.get_grid_positions(fig)
+    px_w, px_h = fig_w * 300, fig_h * 300
+    panel_px = (int(np.ceil((rights[0] - lefts[0]) * px_w)),
+                int(np.ceil((tops[0] - bottoms[0]) * px_h)))
+
+    # Paste all panels into one composite covering the grid, so the outputs
+    # resample a single image instead of one image per panel
+    grid_left, grid_top = lefts[0], tops[0]
+    composite = Image.new("RGB", (int(np.ceil((rights[-1] - grid_left) * px_w)),
+                                  int(np.ceil((grid_top - bottoms[-1]) * px_h))), "white")
     letters = list("abcdefgh")
-    for i, img in enumerate(imgs):
+    for i, path in enumerate(paths):
         r = i // cols
         c = i % cols
-        ax = fig.add_subplot(gs[r, c])
-        ax.imshow(img)
-        ax.set_axis_off()
-
-        # Panel letter: 8 pt bold
-        ax.text(
-            0.01, 0.98, letters[i],
-            transform=ax.transAxes,
+        img = Image.fromarray(_load_panel(path, panel_px))
+        # Centre within the cell, as imshow with equal aspect did
+        x = round((lefts[c] - grid_left) * px_w) + (panel_px[0] - img.width) // 2
+        y = round((grid_top - tops[r]) * px_h) + (panel_px[1] - img.height) // 2
+        composite.paste(img, (x, y))
+
+        # Panel letter: 8 pt bold, top-left of the panel image
+        fig.text(
+            grid_left + (x + 0.01 * img.width) / px_w,
+            grid_top - (y + 0.02 * img.height) / px_h,
+            letters[i],
             ha="left", va="top",
             fontsize=8, fontweight="bold",
-            color="black"
+            color="black", zorder=3
         )
 
+    ax = fig.add_axes([grid_left, bottoms[-1], rights[-1] - grid_left, grid_top - bottoms[-1]])
+    ax.imshow(np.asarray(composite), aspect="auto")
+    ax.set_axis_off()
+
     # Add figure caption at bottom
     caption_text = (
         "Figure X | Evidence-weighted prioritization and robustness assessment for geroscience interventions. "
@@ -657,70 +757,105 @@ def create_multipanel_a_to_h(
     png_path = here / f"{out_stem}_preview.png"
 
     fig.savefig(str(pdf_path), format="pdf")
-    fig.savefig(str(tiff_path), format="tiff", dpi=300, pil_kwargs={"compression": "tiff_lzw"})
-    fig.savefig(str(png_path), format="png", dpi=200)
+    _save_tiff(fig, tiff_path)
+    # 200 dpi preview downsampled from the 300 dpi TIFF, no second render
+    with Image.open(tiff_path) as img:
+        img.thumbnail((img.width * 2 // 3, img.height * 2 // 3), Image.Resampling.LANCZOS)
+        img.save(png_path, optimize=True, dpi=(200, 200))
 
-    plt.close(fig)
     print(f"Saved multipanel: {pdf_path.name}, {tiff_path.name}, {png_path.name}")
+    return [pdf_path, tiff_path, png_path]
+
+
+def _render(task):
+    """Call one figure function; module-level so it pickles to workers"""
+    fn, args, formats, output_dir = task
+    return fn(*args, output_dir=output_dir, formats=formats)
+
+
+def generate_all(input_dir, output_dir=".", formats=SAVE_FORMATS, n_jobs=None):
+    """
+    Generate Figures 1–8 and the multipanel from the analysis outputs in input_dir.
 
+    input_dir must contain Intervention_list_&_scores.xlsx,
+    weighted_score_intervals.csv and ranking_robustness_weights_p5.csv.
+    Figures are written to output_dir (created if needed); returns the list
+    of files written. n_jobs caps the worker processes (default: all cores);
+    at most one process per figure is started.
+    """
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-def main():
-    """Generate all figures for publication"""
     print("Loading data files...")
     print("=" * 60)
+
+    excel_data = read_excel_sheet(input_dir / 'Intervention_list_&_scores.xlsx', 'Sheet1')
+    print("✓ Loaded Excel data (Intervention_list_&_scores.xlsx)")
+
+    intervals_data = pd.read_csv(input_dir / 'weighted_score_intervals.csv')
+    print("✓ Loaded weighted score intervals")
+
+    robustness_data = pd.read_csv(input_dir / 'ranking_robustness_weights_p5.csv')
+    print("✓ Loaded ranking robustness data")
+
+    print("\nGenerating figures")
+    print("=" * 60)
     
-    # Load data files
+    # Figures 1-8 are independent; render them in parallel processes
+    tasks = [
+        (create_figure1, (), formats, output_dir),
+        (create_figure2, (), formats, output_dir),
+        (create_figure3, (), formats, output_dir),
+        (create_figure4, (excel_data,), formats, output_dir),
+        (create_figure5, (intervals_data,), formats, output_dir),
+        (create_figure6, (excel_data,), formats, output_dir),
+        (create_figure7, (excel_data,), formats, output_dir),
+        (create_figure8, (), formats, output_dir),
+    ]
+    n_workers = min(len(tasks), n_jobs or os.cpu_count() or 1)
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            written = list(ex.map(_render, tasks))
+    else:
+        written = [_render(task) for task in tasks]
+
+    # Combine Figures 1–8 into multipanel (a–h)
+    written.append(create_multipanel_a_to_h(panel_dir=output_dir))
+    return [path for paths in written for path in paths]
+
+
+def main(argv=None):
+    """Generate all figures for publication; returns the paths written"""
+    ap = argparse.ArgumentParser(description='Generate all publication figures')
+    ap.add_argument('--input-dir', type=Path, default=Path(__file__).resolve().parent / 'output',
+                    help='Directory holding the analysis outputs (default: output/ next to this script)')
+    ap.add_argument('-o', '--outdir', type=Path, default=Path('.'),
+                    help='Directory to write the figures to (default: current directory)')
+    ap.add_argument('--eps', action='store_true',
+                    help='Also write EPS for each figure (slow; PDF is always written)')
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                    help='Worker processes for Figures 1-8, at most 8 (default: all cores)')
+    args = ap.parse_args(argv)
+    formats = SAVE_FORMATS + ('eps',) if args.eps else SAVE_FORMATS
+
     try:
-        # Load Excel data
-        excel_data = pd.read_excel('/mnt/user-data/uploads/Intervention_list_&_scores.xlsx', sheet_name='Sheet1')
-        print("✓ Loaded Excel data (Intervention_list_&_scores.xlsx)")
-        
-        # Load CSV data
-        intervals_data = pd.read_csv('/mnt/user-data/uploads/weighted_score_intervals.csv')
-        print("✓ Loaded weighted score intervals")
-        
-        robustness_data = pd.read_csv('/mnt/user-data/uploads/ranking_robustness_weights_p5.csv')
-        print("✓ Loaded ranking robustness data")
-        
-    except Exception as e:
+        written = generate_all(args.input_dir, args.outdir, formats, args.jobs)
+    except FileNotFoundError as e:
         print(f"Error loading data files: {e}")
-        print("Please ensure the following files are in /mnt/user-data/uploads/:")
+        print(f"Please ensure the following files are in {args.input_dir}/:")
         print("  - Intervention_list_&_scores.xlsx")
         print("  - weighted_score_intervals.csv")
         print("  - ranking_robustness_weights_p5.csv")
-        return
-    
-    print("\nGenerating figures")
-    print("=" * 60)
-    
-    create_figure1()
-    create_figure2()
-    create_figure3()
-    create_figure4(excel_data)
-    create_figure5(intervals_data)
-    create_figure6(excel_data)
-    create_figure7(excel_data)
-    create_figure8()
-
-    # Combine Figures 1–8 into multipanel (a–h)
-    create_multipanel_a_to_h()
+        sys.exit(1)
 
     print("=" * 60)
     print("All figures generated successfully!")
-    print("\nIndividual figure files created:")
-    print("- Figure1_Mortality_Risk_Factors.tiff/.eps")
-    print("- Figure2_Age_Stratified_Mortality.tiff/.eps")
-    print("- Figure3_US_Mortality_by_Age.tiff/.eps")
-    print("- Figure4_Readiness_vs_Impact.tiff/.eps")
-    print("- Figure5_Rank_Stability.tiff/.eps")
-    print("- Figure6_Domain_Contributions.tiff/.eps")
-    print("- Figure7_Stakeholder_Sensitivity.tiff/.eps")
-    print("- Figure8_MCDA_Framework.tiff/.eps")
-    print("\nMultipanel figure files created:")
-    print("- Figure9_Multipanel_a-h.pdf (vector format)")
-    print("- Figure9_Multipanel_a-h.tiff (300 DPI with caption)")
-    print("- Figure9_Multipanel_a-h_preview.png (200 DPI preview)")
+    print(f"\nFigure files created in {args.outdir}:")
+    for path in written:
+        print(f"- {path.name}")
     print("\nReady")
+    return written
 
 if __name__ == "__main__":
     main()
@@ -7,7 +7,7 @@ This script orchestrates a 2-step workflow:
 2. Generate all publication figures
 
 Usage:
-    python run_pipeline.py --input Intervention_scores.xlsx
+    python run_pipeline.py --input analysis/Intervention_scores.xlsx
     
     # Or with custom parameters:
     python run_pipeline.py -i data/Intervention_scores.xlsx \
@@ -15,24 +15,36 @@ Usage:
                            --mc-runs 10000
 """
 
-import subprocess
+import os
 import sys
+import traceback
 from pathlib import Path
 import argparse
-import shutil
 
+REPO_DIR = Path(__file__).resolve().parent
 
-def run_command(cmd, description):
-    """Run a command and handle errors"""
+# BLAS thread-pool variables limited per worker when running with -j > 1
+BLAS_THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+
+
+def run_stage(func, argv, description):
+    """Run a pipeline stage's main(argv) in this process, handle errors and return its result"""
     print("\n" + "=" * 70)
     print(f"STEP: {description}")
     print("=" * 70)
-    print(f"Running: {' '.join(str(x) for x in cmd)}\n")
-    
-    result = subprocess.run(cmd, capture_output=False, text=True)
-    
-    if result.returncode != 0:
-        print(f"\n❌ ERROR: {description} failed with exit code {result.returncode}")
+    print(f"Running: {func.__module__}.main({' '.join(str(x) for x in argv)})\n")
+    
+    try:
+        result = func(argv)
+    except SystemExit as e:
+        # argparse reports bad arguments by exiting
+        if e.code not in (None, 0):
+            print(f"\n❌ ERROR: {description} failed with exit code {e.code}")
+            sys.exit(1)
+        result = None
+    except Exception:
+        traceback.print_exc()
+        print(f"\n❌ ERROR: {description} failed")
         sys.exit(1)
     
     print(f"\n✓ {description} completed successfully")
@@ -71,8 +83,8 @@ Examples:
     parser.add_argument(
         '-i', '--input',
         type=Path,
-        default=Path('Intervention_scores.xlsx'),
-        help='Input Excel file with intervention scores (default: Intervention_scores.xlsx)'
+        default=REPO_DIR / 'analysis' / 'Intervention_scores.xlsx',
+        help='Input Excel file with intervention scores (default: analysis/Intervention_scores.xlsx)'
     )
     parser.add_argument(
         '-s', '--sheet',
@@ -103,6 +115,19 @@ Examples:
         default=0.05,
         help='Weight perturbation level (default: 0.05 = ±5%%)'
     )
+    parser.add_argument(
+        '--eps',
+        action='store_true',
+        help='Also write EPS versions of the figures (PDF is always written)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Parallel workers: MC analysis threads and figure processes (the figure '
+             'stage uses at most 8, one per figure). Each worker keeps BLAS to one '
+             'thread unless OMP_NUM_THREADS etc. are set (default: all cores)'
+    )
     parser.add_argument(
         '--skip-mc',
         action='store_true',
@@ -115,6 +140,14 @@ Examples:
     )
     
     args = parser.parse_args()
+
+    # The -j workers already fill the cores; a BLAS thread pool in each of
+    # them would oversubscribe the machine. This must happen before numpy is
+    # first imported (the stages are imported lazily below); worker
+    # processes inherit it, and explicit user settings win.
+    if args.jobs > 1:
+        for var in BLAS_THREAD_VARS:
+            os.environ.setdefault(var, '1')
     
     print("\n" + "=" * 70)
     print("GEROSCIENCE MCDA - SIMPLIFIED REPRODUCIBLE PIPELINE")
@@ -125,6 +158,7 @@ Examples:
     print(f"MC iterations:       {args.mc_runs:,}")
     print(f"MC noise level:      ±{args.mc_noise}")
     print(f"Weight perturbation: ±{args.mc_wpert * 100}%")
+    print(f"Parallel workers:    {args.jobs}")
     
     # Create output directory
     args.outdir.mkdir(parents=True, exist_ok=True)
@@ -143,14 +177,17 @@ Examples:
     
     # STEP 1: MC Analysis (includes data preparation)
     if not args.figures_only and not args.skip_mc:
-        run_command(
+        # Imported here so that --help does not pay for numpy/pandas/scipy
+        from analysis import mc_ranking_analysis
+        run_stage(
+            mc_ranking_analysis.main,
             [
-                sys.executable, 'analysis/mc_ranking_analysis.py',
                 '-i', str(args.input),
                 '-s', args.sheet,
                 '-r', str(args.mc_runs),
                 '--noise', str(args.mc_noise),
                 '--wpert', str(args.mc_wpert),
+                '-j', str(args.jobs),
                 '-o', str(args.outdir)
             ],
             "MC Analysis (data prep + Monte Carlo)"
@@ -170,57 +207,19 @@ Examples:
     verify_file(robustness_csv, "Ranking robustness")
     
     # STEP 2: Generate figures
-    print("\n" + "=" * 70)
-    print("SETUP: Preparing files for figure generation")
-    print("=" * 70)
-    
-    # Create a temporary directory with expected file locations
-    fig_input_dir = args.outdir / 'figure_inputs'
-    fig_input_dir.mkdir(exist_ok=True)
-    
-    # Copy files to expected names
-    shutil.copy2(intervention_list, fig_input_dir / 'Intervention_list_&_scores.xlsx')
-    shutil.copy2(intervals_csv, fig_input_dir / 'weighted_score_intervals.csv')
-    shutil.copy2(robustness_csv, fig_input_dir / 'ranking_robustness_weights_p5.csv')
-    
-    print(f"✓ Prepared figure inputs in: {fig_input_dir}")
-    
-    # Create modified figure generation script that uses our output directory
-    print("\n" + "=" * 70)
-    print("GENERATING: Creating figures")
-    print("=" * 70)
-    
-    # Read the original script
-    with open('generate_figures_complete.py', 'r') as f:
-        fig_script = f.read()
-    
-    # Modify paths to use our output directory
-    fig_script_modified = fig_script.replace(
-        "'/mnt/user-data/uploads/",
-        f"'{fig_input_dir}/"
-    )
-    
-    # Write modified script
-    modified_script_path = args.outdir / 'generate_figures_temp.py'
-    with open(modified_script_path, 'w') as f:
-        f.write(fig_script_modified)
-    
-    # Run figure generation from output directory
-    run_command(
-        [sys.executable, str(modified_script_path)],
+    # Figure generation runs in-process and reads the analysis outputs
+    # straight from the output directory and writes the figures back into it
+    from generate_figures_complete import main as generate_figures
+    fig_argv = ['--input-dir', str(args.outdir), '-o', str(args.outdir),
+                '-j', str(args.jobs)]
+    if args.eps:
+        fig_argv.append('--eps')
+    figure_files = run_stage(
+        generate_figures,
+        fig_argv,
         "Figure Generation (all 8 figures + multipanel)"
     )
     
-    # Move generated figures to output directory
-    for pattern in ['Figure*.tiff', 'Figure*.eps', 'Figure*.pdf', 'Figure*.png']:
-        for fig_file in Path('.').glob(pattern):
-            dest = args.outdir / fig_file.name
-            shutil.move(str(fig_file), str(dest))
-            print(f"  → Moved {fig_file.name} to {args.outdir}/")
-    
-    # Clean up temporary files
-    modified_script_path.unlink()
-    
     # Final summary
     print("\n" + "=" * 70)
     print("✓ PIPELINE COMPLETED SUCCESSFULLY!")
@@ -233,14 +232,9 @@ Examples:
     print(f"   - {intervals_csv.name}")
     print(f"   - {robustness_csv.name}")
     
-    print("\n2. Individual figures (TIFF + EPS):")
-    for i in range(1, 9):
-        print(f"   - Figure{i}_*.tiff/.eps")
-    
-    print("\n3. Multipanel figure:")
-    print("   - Figure9_Multipanel_a-h.pdf (vector format)")
-    print("   - Figure9_Multipanel_a-h.tiff (300 DPI with caption)")
-    print("   - Figure9_Multipanel_a-h_preview.png (preview)")
+    print("\n2. Figures:")
+    for path in figure_files or []:
+        print(f"   - {path.name}")
     
     print("\n" + "=" * 70)
     print("Ready for publication submission!")
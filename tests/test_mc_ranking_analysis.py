@@ -0,0 +1,83 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_module():
+    path = REPO_ROOT / "analysis" / "mc_ranking_analysis.py"
+    spec = importlib.util.spec_from_file_location("mc_ranking_analysis", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_inputs(n_items=30, seed=0):
+    rng = np.random.default_rng(seed)
+    scores = rng.integers(1, 6, size=(n_items, 6)).astype(float)
+    weights = np.array([0.30, 0.10, 0.10, 0.20, 0.20, 0.10])
+    return scores, weights
+
+
+def test_robustness_ranks_are_permutations():
+    mc = load_module()
+    scores, weights = make_inputs()
+    rb = mc.robustness_weights(scores, weights, r=300, wpert=0.05, seed=1)
+
+    n_items = scores.shape[0]
+    # Every replicate assigns ranks 1..n exactly once, so the means sum to n(n+1)/2
+    assert np.isclose(rb["rank_mean"].sum(), n_items * (n_items + 1) / 2)
+    assert np.isclose(rb["p_top1"].sum(), 1.0)
+    assert np.isclose(rb["p_top3"].sum(), 3.0)
+    assert (rb["rank_lo"] <= rb["rank_hi"]).all()
+
+
+def test_mc_results_independent_of_worker_count():
+    mc = load_module()
+    scores, weights = make_inputs()
+    r = 3 * mc.MC_CHUNK + 17
+
+    serial = mc.mc_score_intervals(scores, weights, r, noise=0.5, seed=42, n_jobs=1)
+    threaded = mc.mc_score_intervals(scores, weights, r, noise=0.5, seed=42, n_jobs=4)
+    for a, b in zip(serial, threaded):
+        np.testing.assert_array_equal(a, b)
+
+    rb_serial = mc.robustness_weights(scores, weights, r, wpert=0.05, seed=123, n_jobs=1)
+    rb_threaded = mc.robustness_weights(scores, weights, r, wpert=0.05, seed=123, n_jobs=4)
+    for key in rb_serial:
+        np.testing.assert_array_equal(rb_serial[key], rb_threaded[key])
+
+
+def test_combined_pass_matches_separate_analyses():
+    mc = load_module()
+    scores, weights = make_inputs()
+    r = 2 * mc.MC_CHUNK + 5
+
+    (mean, lo, hi), rb = mc.mc_combined(scores, weights, r, noise=0.5, wpert=0.05,
+                                        seed_scores=42, seed_weights=123, n_jobs=2)
+    for a, b in zip((mean, lo, hi), mc.mc_score_intervals(scores, weights, r, 0.5, 42)):
+        np.testing.assert_array_equal(a, b)
+    rb_alone = mc.robustness_weights(scores, weights, r, 0.05, 123)
+    for key in rb_alone:
+        np.testing.assert_array_equal(rb[key], rb_alone[key])
+
+
+def test_read_scores_sheet_falls_back_to_openpyxl(monkeypatch):
+    mc = load_module()
+    path = REPO_ROOT / "analysis" / "Intervention_scores.xlsx"
+    excel_file = pd.ExcelFile
+
+    def no_calamine(path, engine=None, **kwargs):
+        # pandas < 2.2 rejects the engine name with a ValueError
+        if engine == "calamine":
+            raise ValueError("Unknown engine: calamine")
+        return excel_file(path, engine=engine, **kwargs)
+
+    monkeypatch.setattr(mc.pd, "ExcelFile", no_calamine)
+    df = mc.read_scores_sheet(path, "Scoring")
+    assert "Intervention" in df.columns
+    assert len(df) == 30